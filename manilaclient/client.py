@@ -21,6 +21,7 @@ if not hasattr(urlparse, 'parse_qsl'):
     urlparse.parse_qsl = cgi.parse_qsl
 
 import requests
+from requests import adapters
 
 from manilaclient import exceptions
 from manilaclient.openstack.common import jsonutils
@@ -31,6 +32,8 @@ from manilaclient import utils
 class HTTPClient(object):
 
     USER_AGENT = 'python-manilaclient'
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
 
     def __init__(self,
                  user,
@@ -63,6 +66,15 @@ class HTTPClient(object):
         self.share_service_name = share_service_name
         self.retries = int(retries or 0)
         self.http_log_debug = http_log_debug
+        self.timeout = timeout
+
+        # NOTE: a shared session keeps connections alive between requests
+        # instead of paying a new TCP/TLS handshake for every call.
+        self.http = requests.Session()
+        adapter = adapters.HTTPAdapter(pool_connections=self.POOL_CONNECTIONS,
+                                       pool_maxsize=self.POOL_MAXSIZE)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
 
         self.management_url = None
         self.auth_token = None
@@ -122,8 +134,11 @@ class HTTPClient(object):
             kwargs['data'] = jsonutils.dumps(kwargs['body'])
             del kwargs['body']
 
+        if self.timeout is not None:
+            kwargs.setdefault('timeout', self.timeout)
+
         self.http_log_req((url, method,), kwargs)
-        resp = requests.request(
+        resp = self.http.request(
             method,
             url,
             verify=self.verify_cert,
@@ -179,7 +194,7 @@ class HTTPClient(object):
                 else:
                     raise
             except requests.exceptions.ConnectionError as e:
-                # Catch a connection refused from requests.request
+                # Catch a connection refused from the requests session
                 self._logger.debug("Connection refused: %s" % e)
                 raise
             self._logger.debug(
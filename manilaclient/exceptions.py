@@ -22,6 +22,11 @@ class NoUniqueMatch(Exception):
     pass
 
 
+class PaginationError(Exception):
+    """The server did not move past the requested page marker."""
+    pass
+
+
 class NoTokenLookupException(Exception):
     """This form of authentication does not support looking up
        endpoints from an existing token."""
@@ -41,18 +41,14 @@ class QuotaClassSetManager(base.ManagerWithFind):
                snapshots=None,
                share_networks=None):
 
-        body = {
-            'quota_class_set': {
-                'class_name': class_name,
-                'shares': shares,
-                'snapshots': snapshots,
-                'gigabytes': gigabytes,
-                'share_networks': share_networks,
-            }
+        fields = {
+            'class_name': class_name,
+            'shares': shares,
+            'snapshots': snapshots,
+            'gigabytes': gigabytes,
+            'share_networks': share_networks,
         }
-
-        for key in body['quota_class_set'].keys():
-            if body['quota_class_set'][key] is None:
-                body['quota_class_set'].pop(key)
+        body = {'quota_class_set': dict((k, v) for k, v in fields.items()
+                                        if v is not None)}
 
         self._update('/os-quota-class-sets/%s' % class_name, body)
@@ -13,6 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import urllib
+
 from manilaclient import base
 
 
@@ -30,46 +32,38 @@ class QuotaSet(base.Resource):
 class QuotaSetManager(base.ManagerWithFind):
     resource_class = QuotaSet
 
+    @staticmethod
+    def _build_url(tenant_id, user_id=None, suffix=''):
+        url = '/os-quota-sets/%s%s' % (tenant_id, suffix)
+        if user_id:
+            url += '?%s' % urllib.urlencode({'user_id': user_id})
+        return url
+
     def get(self, tenant_id, user_id=None):
         if hasattr(tenant_id, 'tenant_id'):
             tenant_id = tenant_id.tenant_id
-        if user_id:
-            url = "/os-quota-sets/%s?user_id=%s" % (tenant_id, user_id)
-        else:
-            url = "/os-quota-sets/%s" % tenant_id
-        return self._get(url, "quota_set")
+        return self._get(self._build_url(tenant_id, user_id), "quota_set")
 
     def update(self, tenant_id, shares=None, snapshots=None, gigabytes=None,
                share_networks=None, force=None, user_id=None):
 
-        body = {
-            'quota_set': {
-                'tenant_id': tenant_id,
-                'shares': shares,
-                'snapshots': snapshots,
-                'gigabytes': gigabytes,
-                'share_networks': share_networks,
-                'force': force,
-            },
+        fields = {
+            'tenant_id': tenant_id,
+            'shares': shares,
+            'snapshots': snapshots,
+            'gigabytes': gigabytes,
+            'share_networks': share_networks,
+            'force': force,
         }
+        body = {'quota_set': dict((k, v) for k, v in fields.items()
+                                  if v is not None)}
 
-        for key in body['quota_set'].keys():
-            if body['quota_set'][key] is None:
-                body['quota_set'].pop(key)
-        if user_id:
-            url = '/os-quota-sets/%s?user_id=%s' % (tenant_id, user_id)
-        else:
-            url = '/os-quota-sets/%s' % tenant_id
-
-        return self._update(url, body, 'quota_set')
+        return self._update(self._build_url(tenant_id, user_id), body,
+                            'quota_set')
 
     def defaults(self, tenant_id):
-        return self._get('/os-quota-sets/%s/defaults' % tenant_id,
+        return self._get(self._build_url(tenant_id, suffix='/defaults'),
                          'quota_set')
 
     def delete(self, tenant_id, user_id=None):
-        if user_id:
-            url = '/os-quota-sets/%s?user_id=%s' % (tenant_id, user_id)
-        else:
-            url = '/os-quota-sets/%s' % tenant_id
-        self._delete(url)
+        self._delete(self._build_url(tenant_id, user_id))
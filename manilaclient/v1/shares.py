@@ -16,17 +16,61 @@
 
 import collections
 import re
+import time
 import urllib
 
 from manilaclient import base
 from manilaclient import exceptions
 
 
+_ACTION_URL = '/shares/%s/action'
+_USERNAME_RE = re.compile(r'[\w.\-_`;\'{}\[\]]{4,32}\Z')
+_IP_CIDR_RE = re.compile(
+    r'\A(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})(?:/([^/]*))?\Z')
+
+
+def _encode_search_opts(search_opts):
+    """Return the urlencoded query for search_opts, skipping empty values.
+
+    Options are sorted by name so that the same filters always produce the
+    same URL.
+    """
+    return urllib.urlencode(sorted((k, v) for (k, v)
+                                   in search_opts.items() if v))
+
+
+_ACCESS_TUPLE_CACHE = {}
+_ACCESS_TUPLE_CACHE_SIZE = 32
+
+
+def _access_tuple(fields):
+    """Return the Access namedtuple type for a tuple of field names.
+
+    namedtuple() compiles a new class on every call, so the generated
+    types are cached per set of fields.
+    """
+    try:
+        return _ACCESS_TUPLE_CACHE[fields]
+    except KeyError:
+        pass
+
+    access_tuple = collections.namedtuple('Access', fields)
+    if len(_ACCESS_TUPLE_CACHE) >= _ACCESS_TUPLE_CACHE_SIZE:
+        _ACCESS_TUPLE_CACHE.clear()
+    _ACCESS_TUPLE_CACHE[fields] = access_tuple
+    return access_tuple
+
+
 class Share(base.Resource):
     """A share is an extra block level storage to the OpenStack instances."""
     def __repr__(self):
         return "<Share: %s>" % self.id
 
+    def get(self):
+        """Reload this share, bypassing the manager's get() cache."""
+        self.manager._invalidate(self)
+        super(Share, self).get()
+
     def update(self, **kwargs):
         """Update this share."""
         self.manager.update(self, **kwargs)
@@ -67,37 +111,29 @@ class Share(base.Resource):
 
     @staticmethod
     def _validate_username(access):
-        valid_useraname_re = '[\w\.\-_\`;\'\{\}\[\]]{4,32}$'
-        username = access
-        if not re.match(valid_useraname_re, username):
+        if not _USERNAME_RE.match(access):
             exc_str = ('Invalid user or group name. Must be 4-32 chars long '
                        'and consist of alfanum and ]{.-_\'`;}[')
             raise exceptions.CommandError(exc_str)
 
     @staticmethod
     def _validate_ip_range(ip_range):
-        ip_range = ip_range.split('/')
         exc_str = ('Supported ip format examples:\n'
                    '\t10.0.0.2, 10.0.0.0/24')
-        if len(ip_range) > 2:
+        match = _IP_CIDR_RE.match(ip_range)
+        if not match:
             raise exceptions.CommandError(exc_str)
-        if len(ip_range) == 2:
+        octets = match.group(1, 2, 3, 4)
+        prefix = match.group(5)
+        if prefix is not None:
             try:
-                prefix = int(ip_range[1])
-                if prefix < 0 or prefix > 32:
+                if not 0 <= int(prefix) <= 32:
                     raise ValueError()
             except ValueError:
                 msg = 'IP prefix should be in range from 0 to 32'
                 raise exceptions.CommandError(msg)
-        ip_range = ip_range[0].split('.')
-        if len(ip_range) != 4:
-            raise exceptions.CommandError(exc_str)
-        for item in ip_range:
-            try:
-                if 0 <= int(item) <= 255:
-                    continue
-                raise ValueError()
-            except ValueError:
+        for item in octets:
+            if int(item) > 255:
                 raise exceptions.CommandError(exc_str)
 
     def reset_state(self, state):
@@ -108,6 +144,19 @@ class Share(base.Resource):
 class ShareManager(base.ManagerWithFind):
     """Manage :class:`Share` resources."""
     resource_class = Share
+    # NOTE: the get() cache is off by default. Set this to a number of
+    # seconds to reuse shares fetched with get() for that long, unless the
+    # share is modified through this manager in the meantime. Changes made
+    # by other clients are not seen until the entry expires.
+    GET_CACHE_TTL = 0
+    GET_CACHE_SIZE = 256
+
+    def __init__(self, api):
+        super(ShareManager, self).__init__(api)
+        self._get_cache = {}
+
+    def _invalidate(self, share):
+        self._get_cache.pop(str(base.getid(share)), None)
 
     def create(self, share_proto, size, snapshot_id=None, name=None,
                description=None, metadata=None, share_network=None,
@@ -123,28 +172,39 @@ class ShareManager(base.ManagerWithFind):
         :rtype: :class:`Share`
         """
 
-        if metadata is None:
-            share_metadata = {}
-        else:
-            share_metadata = metadata
-
-        body = {'share': {'size': size,
-                          'snapshot_id': snapshot_id,
-                          'name': name,
-                          'description': description,
-                          'metadata': share_metadata,
-                          'share_proto': share_proto,
-                          'share_network_id': base.getid(share_network),
-                          'volume_type': volume_type}}
+        fields = {
+            'snapshot_id': snapshot_id,
+            'name': name,
+            'description': description,
+            'share_network_id': base.getid(share_network),
+            'volume_type': volume_type,
+        }
+        share = dict((k, v) for k, v in fields.items() if v is not None)
+        share.update({'size': size,
+                      'share_proto': share_proto,
+                      'metadata': metadata or {}})
+        body = {'share': share}
         return self._create('/shares', body, 'share')
 
     def get(self, share_id):
         """Get a share.
 
+        The result is cached only if GET_CACHE_TTL is set.
+
         :param share_id: The ID of the share to delete.
         :rtype: :class:`Share`
         """
-        return self._get("/shares/%s" % share_id, "share")
+        key = str(share_id)
+        cached = self._get_cache.get(key)
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+
+        share = self._get("/shares/%s" % share_id, "share")
+        if self.GET_CACHE_TTL > 0:
+            if len(self._get_cache) >= self.GET_CACHE_SIZE:
+                self._get_cache.clear()
+            self._get_cache[key] = (time.time() + self.GET_CACHE_TTL, share)
+        return share
 
     def update(self, share, **kwargs):
         """Updates a share.
@@ -156,6 +216,7 @@ class ShareManager(base.ManagerWithFind):
             return
 
         body = {'share': kwargs, }
+        self._invalidate(share)
         return self._update("/shares/%s" % share.id, body)
 
     def list(self, detailed=True, search_opts=None):
@@ -164,10 +225,7 @@ class ShareManager(base.ManagerWithFind):
         :rtype: list of :class:`Share`
         """
         if search_opts:
-            query_string = urllib.urlencode([(key, value)
-                                             for (key, value)
-                                             in search_opts.items()
-                                             if value])
+            query_string = _encode_search_opts(search_opts)
             if query_string:
                 query_string = "?%s" % (query_string,)
         else:
@@ -180,15 +238,45 @@ class ShareManager(base.ManagerWithFind):
 
         return self._list(path, 'shares')
 
+    def list_iter(self, detailed=True, search_opts=None, page_size=500):
+        """Iterate over all shares, fetching them a page at a time.
+
+        Pages are requested with ``limit`` and ``marker`` so that only one
+        page of :class:`Share` objects is held in memory at once. Pages are
+        requested until one comes back empty, since the server may return
+        fewer than ``page_size`` shares per page.
+
+        :param page_size: Number of shares to request per page.
+        :rtype: iterator of :class:`Share`
+        :raises PaginationError: if the server returns the marker share
+                                 again instead of the page after it.
+        """
+        search_opts = dict(search_opts or {})
+        search_opts['limit'] = page_size
+        while True:
+            page = self.list(detailed=detailed, search_opts=search_opts)
+            if not page:
+                return
+            marker = search_opts.get('marker')
+            if marker is not None and any(share.id == marker
+                                          for share in page):
+                raise exceptions.PaginationError(
+                    'Server ignored the page marker %s' % marker)
+            for share in page:
+                yield share
+            search_opts['marker'] = page[-1].id
+
     def delete(self, share):
         """Delete a share.
 
         :param share: The :class:`Share` to delete.
         """
-        self._delete("/shares/%s" % base.getid(share))
+        share_id = base.getid(share)
+        self._invalidate(share_id)
+        self._delete("/shares/%s" % share_id)
 
     def force_delete(self, share):
-        return self._action('os-force_delete', base.getid(share))
+        return self._action('os-force_delete', share)
 
     def allow(self, share, access_type, access):
         """Allow access from IP to a shares.
@@ -214,8 +302,8 @@ class ShareManager(base.ManagerWithFind):
         """Get access list to the share."""
         access_list = self._action("os-access_list", share)[1]["access_list"]
         if access_list:
-            t = collections.namedtuple('Access', access_list[0].keys())
-            return [t(*value.values()) for value in access_list]
+            t = _access_tuple(tuple(access_list[0].keys()))
+            return [t(**value) for value in access_list]
         else:
             return []
 
@@ -235,7 +323,9 @@ class ShareManager(base.ManagerWithFind):
         :param metadata: A list of keys to be set.
         """
         body = {'metadata': metadata}
-        return self._create("/shares/%s/metadata" % base.getid(share),
+        share_id = base.getid(share)
+        self._invalidate(share_id)
+        return self._create("/shares/%s/metadata" % share_id,
                             body, "metadata")
 
     def delete_metadata(self, share, keys):
@@ -245,8 +335,10 @@ class ShareManager(base.ManagerWithFind):
         :param share: The :class:`Share`.
         :param keys: A list of keys to be removed.
         """
+        share_id = base.getid(share)
+        self._invalidate(share_id)
         for k in keys:
-            self._delete("/shares/%s/metadata/%s" % (base.getid(share), k))
+            self._delete("/shares/%s/metadata/%s" % (share_id, k))
 
     def update_all_metadata(self, share, metadata):
         """Update all metadata of a share.
@@ -255,14 +347,18 @@ class ShareManager(base.ManagerWithFind):
         :param metadata: A list of keys to be updated.
         """
         body = {'metadata': metadata}
-        return self._update("/shares/%s/metadata" % base.getid(share), body)
+        share_id = base.getid(share)
+        self._invalidate(share_id)
+        return self._update("/shares/%s/metadata" % share_id, body)
 
     def _action(self, action, share, info=None, **kwargs):
         """Perform a share 'action'."""
         body = {action: info}
-        self.run_hooks('modify_body_for_action', body, **kwargs)
-        url = '/shares/%s/action' % base.getid(share)
-        return self.api.client.post(url, body=body)
+        share_id = base.getid(share)
+        self._invalidate(share_id)
+        if self._hooks_map.get('modify_body_for_action'):
+            self.run_hooks('modify_body_for_action', body, **kwargs)
+        return self.api.client.post(_ACTION_URL % share_id, body=body)
 
     def reset_state(self, share, state):
         """Update the provided share with the provided state."""
@@ -6,6 +6,19 @@ wrong the tests might raise AssertionError. I've indicated in comments the
 places where actual behavior differs from the spec.
 """
 
+from six.moves import intern
+
+
+def intern_call(method, url):
+    """Intern the method and url of a fake call.
+
+    Both the recorded calls and the expected ones go through this, so the
+    comparisons in assert_called() can short-circuit on identity.
+    """
+    if isinstance(url, str):
+        url = intern(url)
+    return intern(method), url
+
 
 def assert_has_keys(dict, required=[], optional=[]):
     keys = dict.keys()
@@ -24,7 +37,7 @@ class FakeClient(object):
         """
         Assert than an API method was just called.
         """
-        expected = (method, url)
+        expected = intern_call(method, url)
         called = self.client.callstack[pos][0:2]
 
         assert self.client.callstack, ("Expected %s %s but no calls "
@@ -40,7 +53,7 @@ class FakeClient(object):
         """
         Assert than an API method was called anytime in the test.
         """
-        expected = (method, url)
+        expected = intern_call(method, url)
 
         assert self.client.callstack, ("Expected %s %s but no calls "
                                        "were made." % expected)
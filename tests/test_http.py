@@ -50,7 +50,7 @@ class ClientTest(utils.TestCase):
     def test_get(self):
         cl = get_authed_client()
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -68,6 +68,39 @@ class ClientTest(utils.TestCase):
 
         test_get_call()
 
+    def test_get_with_timeout(self):
+        cl = get_authed_client()
+        cl.timeout = 30
+
+        @mock.patch.object(requests.Session, "request", mock_request)
+        def test_get_call():
+            cl.get("/hi")
+            headers = {"X-Auth-Token": "token",
+                       "X-Auth-Project-Id": "project_id",
+                       "User-Agent": cl.USER_AGENT,
+                       'Accept': 'application/json', }
+            mock_request.assert_called_with(
+                "GET",
+                "http://example.com/hi",
+                headers=headers,
+                timeout=30,
+                **self.TEST_REQUEST_BASE)
+
+        test_get_call()
+
+    def test_session_uses_pooled_adapter(self):
+        with mock.patch.object(client, 'adapters') as adapters:
+            cl = get_authed_client()
+        adapter = adapters.HTTPAdapter
+        adapter.assert_called_once_with(
+            pool_connections=client.HTTPClient.POOL_CONNECTIONS,
+            pool_maxsize=client.HTTPClient.POOL_MAXSIZE)
+        self.assertIsInstance(cl.http, requests.Session)
+        self.assertIs(adapter.return_value,
+                      cl.http.get_adapter('https://example.com'))
+        self.assertIs(adapter.return_value,
+                      cl.http.get_adapter('http://example.com'))
+
     def test_get_reauth_0_retries(self):
         cl = get_authed_client(retries=0)
 
@@ -82,7 +115,7 @@ class ClientTest(utils.TestCase):
             cl.auth_token = "token"
 
         @mock.patch.object(cl, 'authenticate', reauth)
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -99,7 +132,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -116,7 +149,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -133,7 +166,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -150,7 +183,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -161,7 +194,7 @@ class ClientTest(utils.TestCase):
     def test_post(self):
         cl = get_authed_client()
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_post_call():
             cl.post("/hi", body=[1, 2, 3])
             headers = {
@@ -184,7 +217,7 @@ class ClientTest(utils.TestCase):
         cl = get_client()
 
         # response must not have x-server-management-url header
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             self.assertRaises(exceptions.AuthorizationFailure, cl.authenticate)
 
@@ -1,8 +1,7 @@
-import cStringIO
 import re
-import sys
 
 import fixtures
+import six
 from testtools import matchers
 
 from manilaclient import exceptions
@@ -27,20 +26,15 @@ class ShellTest(utils.TestCase):
                                                          self.FAKE_ENV[var]))
 
     def shell(self, argstr):
-        orig = sys.stdout
-        try:
-            sys.stdout = cStringIO.StringIO()
-            _shell = manilaclient.shell.OpenStackManilaShell()
-            _shell.main(argstr.split())
-        except SystemExit:
-            exc_type, exc_value, exc_traceback = sys.exc_info()
-            self.assertEqual(exc_value.code, 0)
-        finally:
-            out = sys.stdout.getvalue()
-            sys.stdout.close()
-            sys.stdout = orig
-
-        return out
+        stdout = six.StringIO()
+        with fixtures.MonkeyPatch('sys.stdout', stdout):
+            try:
+                _shell = manilaclient.shell.OpenStackManilaShell()
+                _shell.main(argstr.split())
+            except SystemExit as e:
+                self.assertEqual(e.code, 0)
+
+        return stdout.getvalue()
 
     def test_help_unknown_command(self):
         self.assertRaises(exceptions.CommandError, self.shell, 'help foofoo')
@@ -17,6 +17,49 @@ from manilaclient.v1 import client
 from tests.v1 import fake_clients as fakes
 
 
+def _allow_access(info):
+    assert set(info) == set(['access_type', 'access_to'])
+    return {'access': {}}
+
+
+def _deny_access(info):
+    assert set(info) == set(['access_id'])
+
+
+def _access_list(info):
+    assert info is None
+    return {'access_list': [{'id': 1111,
+                             'access_type': 'ip',
+                             'access_to': '10.0.0.1',
+                             'state': 'active'},
+                            {'id': 2222,
+                             'access_type': 'sid',
+                             'access_to': 'fake_user',
+                             'state': 'new'}]}
+
+
+def _reset_status(info):
+    assert 'status' in info
+
+
+def _force_delete(info):
+    assert info is None
+
+
+_SHARE_ACTIONS = {
+    'os-allow_access': _allow_access,
+    'os-deny_access': _deny_access,
+    'os-access_list': _access_list,
+    'os-reset_status': _reset_status,
+    'os-force_delete': _force_delete,
+}
+
+_SNAPSHOT_ACTIONS = {
+    'os-reset_status': _reset_status,
+    'os-force_delete': _force_delete,
+}
+
+
 class FakeClient(fakes.FakeClient):
 
     def __init__(self, *args, **kwargs):
@@ -28,36 +71,43 @@ class FakeClient(fakes.FakeClient):
 
 class FakeHTTPClient(fakes.FakeHTTPClient):
 
+    # NOTE: the most shares get_shares_detail() returns per page, like a
+    # server-side limit. None means no cap.
+    max_limit = None
+
     def get_shares_1234(self, **kw):
         share = {'share': {'id': 1234, 'name': 'sharename'}}
         return (200, {}, share)
 
-    def get_shares_detail(self, **kw):
-        shares = {'shares': [{'id': 1234,
-                              'name': 'sharename',
-                              'attachments': [{'server_id': 111}]}]}
-        return (200, {}, shares)
+    def get_shares_detail(self, limit=None, marker=None, **kw):
+        shares = [{'id': 1234,
+                   'name': 'sharename',
+                   'attachments': [{'server_id': 111}]},
+                  {'id': 1235, 'name': 'sharename2'},
+                  {'id': 1236, 'name': 'sharename3'}]
+        if marker is not None:
+            ids = [str(share['id']) for share in shares]
+            shares = shares[ids.index(marker) + 1:]
+        if limit is not None:
+            limit = int(limit)
+            if self.max_limit is not None:
+                limit = min(limit, self.max_limit)
+            shares = shares[:limit]
+        return (200, {}, {'shares': shares})
 
     def get_snapshots_1234(self, **kw):
         snapshot = {'snapshot': {'id': 1234, 'name': 'sharename'}}
         return (200, {}, snapshot)
 
     def post_snapshots_1234_action(self, body, **kw):
-        _body = None
-        resp = 202
-        assert len(list(body)) == 1
-        action = list(body)[0]
-        if action == 'os-reset_status':
-            assert 'status' in body['os-reset_status']
-        elif action == 'os-force_delete':
-            assert body[action] is None
-        else:
+        assert len(body) == 1
+        action = next(iter(body))
+        handler = _SNAPSHOT_ACTIONS.get(action)
+        if handler is None:
             raise AssertionError("Unexpected action: %s" % action)
-        return (resp, {}, _body)
+        return (202, {}, handler(body[action]))
 
     def get_snapshots_detail(self, **kw):
-        print kw
-        # print kw['share_id']
         snapshots = {'snapshots': [{
             'id': 1234,
             'created_at': '2012-08-27T00:00:00.000000',
@@ -72,24 +122,12 @@ class FakeHTTPClient(fakes.FakeHTTPClient):
         return (200, {}, snapshots)
 
     def post_shares_1234_action(self, body, **kw):
-        _body = None
-        resp = 202
-        assert len(body.keys()) == 1
-        action = body.keys()[0]
-        if action == 'os-allow_access':
-            assert body[action].keys() == ['access_type', 'access_to']
-            _body = {'access': {}}
-        elif action == 'os-deny_access':
-            assert body[action].keys() == ['access_id']
-        elif action == 'os-access_list':
-            assert body[action] is None
-        elif action == 'os-reset_status':
-            assert 'status' in body['os-reset_status']
-        elif action == 'os-force_delete':
-            assert body[action] is None
-        else:
+        assert len(body) == 1
+        action = next(iter(body))
+        handler = _SHARE_ACTIONS.get(action)
+        if handler is None:
             raise AssertionError("Unexpected share action: %s" % action)
-        return (resp, {}, _body)
+        return (202, {}, handler(body[action]))
 
     def post_shares(self, **kwargs):
         return (202, {}, {'share': {}})
@@ -177,7 +215,7 @@ class FakeHTTPClient(fakes.FakeHTTPClient):
                           'extra_specs': {}}})
 
     def post_types_1_extra_specs(self, body, **kw):
-        assert list(body) == ['extra_specs']
+        assert set(body) == set(['extra_specs'])
         return (200, {}, {'extra_specs': {'k': 'v'}})
 
     def delete_types_1_extra_specs_k(self, **kw):
@@ -32,6 +32,13 @@ class QuotaClassSetsTest(utils.TestCase):
         q.update(shares=2)
         cs.assert_called('PUT', '/os-quota-class-sets/test')
 
+    def test_update_quota_skips_unset_values(self):
+        q = cs.quota_classes.get('test')
+        q.update(shares=2)
+        cs.assert_called(
+            'PUT', '/os-quota-class-sets/test',
+            {'quota_class_set': {'class_name': 'test', 'shares': 2}})
+
     def test_refresh_quota(self):
         q = cs.quota_classes.get('test')
         q2 = cs.quota_classes.get('test')
@@ -34,6 +34,12 @@ class QuotaSetsTest(utils.TestCase):
         url = '/os-quota-sets/%s?user_id=%s' % (tenant_id, user_id)
         cs.assert_called('GET', url)
 
+    def test_user_quotas_get_encodes_user_id(self):
+        tenant_id = 'test'
+        cs.quotas.get(tenant_id, user_id='fake user&id')
+        url = '/os-quota-sets/%s?user_id=fake+user%%26id' % tenant_id
+        cs.assert_called('GET', url)
+
     def test_tenant_quotas_defaults(self):
         tenant_id = 'test'
         cs.quotas.defaults(tenant_id)
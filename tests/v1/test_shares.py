@@ -15,6 +15,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import mock
+
+from manilaclient import exceptions
 from manilaclient import extension
 from manilaclient.v1 import shares
 
@@ -38,6 +41,50 @@ class SharesTest(utils.TestCase):
         cs.shares.create('cifs', 2)
         cs.assert_called('POST', '/shares')
 
+    def test_get_share_uses_patched_fake_handler(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        resp = (200, {}, {'share': {'id': '1234', 'name': 'patched'}})
+        with mock.patch.object(cs.client, 'get_shares_1234',
+                               mock.Mock(return_value=resp)):
+            share = cs.shares.get('1234')
+        self.assertEqual('patched', share.name)
+
+    def test_get_share_is_cached(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        cs.shares.GET_CACHE_TTL = 2
+        share = cs.shares.get('1234')
+        self.assertIs(share, cs.shares.get(1234))
+        self.assertEqual(1, len(cs.client.callstack))
+
+    def test_get_share_cache_invalidated_on_action(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        cs.shares.GET_CACHE_TTL = 2
+        share = cs.shares.get('1234')
+        cs.shares.reset_state(share, 'error')
+        cs.shares.get('1234')
+        cs.assert_called('GET', '/shares/1234')
+
+    def test_get_share_cache_disabled_by_default(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        cs.shares.get('1234')
+        cs.shares.get('1234')
+        self.assertEqual(2, len(cs.client.callstack))
+
+    def test_refresh_share_bypasses_cache(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        cs.shares.GET_CACHE_TTL = 2
+        share = cs.shares.get('1234')
+        share.get()
+        self.assertEqual(2, len(cs.client.callstack))
+
+    def test_create_share_omits_unset_fields(self):
+        cs.shares.create('nfs', 1, name='fake_name')
+        expected = {'share': {'size': 1,
+                              'share_proto': 'nfs',
+                              'name': 'fake_name',
+                              'metadata': {}}}
+        cs.assert_called('POST', '/shares', expected)
+
     def test_delete_share(self):
         share = cs.shares.get('1234')
         cs.shares.delete(share)
@@ -53,12 +100,76 @@ class SharesTest(utils.TestCase):
         cs.shares.list()
         cs.assert_called('GET', '/shares/detail')
 
+    def test_list_shares_with_search_opts(self):
+        search_opts = {'status': 'available', 'name': None,
+                       'project_id': ''}
+        cs.shares.list(search_opts=search_opts)
+        cs.assert_called('GET', '/shares/detail?status=available')
+
+    def test_list_shares_search_opts_keep_value_types(self):
+        cs.shares.list(search_opts={'all_tenants': 1})
+        cs.assert_called('GET', '/shares/detail?all_tenants=1')
+        cs.shares.list(search_opts={'all_tenants': True})
+        cs.assert_called('GET', '/shares/detail?all_tenants=True')
+
+    def test_list_iter_shares(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        shares = list(cs.shares.list_iter(page_size=2))
+        self.assertEqual([1234, 1235, 1236], [share.id for share in shares])
+        self.assertEqual(
+            ['/shares/detail?limit=2',
+             '/shares/detail?limit=2&marker=1235',
+             '/shares/detail?limit=2&marker=1236'],
+            [call[1] for call in cs.client.callstack])
+
+    def test_list_iter_shares_short_page(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        cs.client.max_limit = 1
+        shares = list(cs.shares.list_iter(page_size=2))
+        self.assertEqual([1234, 1235, 1236], [share.id for share in shares])
+        self.assertEqual(4, len(cs.client.callstack))
+        cs.assert_called('GET', '/shares/detail?limit=2&marker=1236')
+
+    def test_list_iter_shares_single_page(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        shares = list(cs.shares.list_iter())
+        self.assertEqual([1234, 1235, 1236], [share.id for share in shares])
+        self.assertEqual(2, len(cs.client.callstack))
+        cs.assert_called('GET', '/shares/detail?limit=500&marker=1236')
+
+    def test_list_iter_shares_marker_ignored(self):
+        cs = fakes.FakeClient(extensions=extensions)
+        resp = (200, {}, {'shares': [{'id': 1234}, {'id': 1235}]})
+        with mock.patch.object(cs.client, 'get_shares_detail',
+                               mock.Mock(return_value=resp)):
+            self.assertRaises(exceptions.PaginationError,
+                              list, cs.shares.list_iter(page_size=2))
+        self.assertEqual(2, len(cs.client.callstack))
+
+    def test_list_shares_search_opts_sorted(self):
+        cs.shares.list(search_opts={'status': 'available', 'name': 'x',
+                                    'all_tenants': 1})
+        url = '/shares/detail?all_tenants=1&name=x&status=available'
+        cs.assert_called('GET', url)
+
     def test_allow_access_to_share(self):
         share = cs.shares.get(1234)
         ip = '192.168.0.1'
         cs.shares.allow(share, 'ip', ip)
         cs.assert_called('POST', '/shares/1234/action')
 
+    def test_access_list(self):
+        access_list = cs.shares.access_list(1234)
+        cs.assert_called('POST', '/shares/1234/action',
+                         {'os-access_list': None})
+        self.assertEqual(2, len(access_list))
+        self.assertEqual(1111, access_list[0].id)
+        self.assertEqual('10.0.0.1', access_list[0].access_to)
+        self.assertEqual('fake_user', access_list[1].access_to)
+        self.assertEqual('new', access_list[1].state)
+        self.assertIs(type(access_list[0]),
+                      type(cs.shares.access_list(1234)[0]))
+
     def test_get_metadata(self):
         cs.shares.get_metadata(1234)
         cs.assert_called('GET', '/shares/1234/metadata')
@@ -73,7 +184,50 @@ class SharesTest(utils.TestCase):
         cs.shares.delete_metadata(1234, keys)
         cs.assert_called('DELETE', '/shares/1234/metadata/key1')
 
+    def test_delete_metadata_multiple_keys(self):
+        cs.shares.delete_metadata(1234, iter(['key1', 'key2']))
+        cs.assert_called('DELETE', '/shares/1234/metadata/key1', pos=-2)
+        cs.assert_called('DELETE', '/shares/1234/metadata/key2')
+
     def test_metadata_update_all(self):
         cs.shares.update_all_metadata(1234, {'k1': 'v1'})
         cs.assert_called('PUT', '/shares/1234/metadata',
                          {'metadata': {'k1': 'v1'}})
+
+    def test_allow_access_to_share_with_prefix(self):
+        share = cs.shares.get(1234)
+        share.allow('ip', '10.0.0.0/24')
+        cs.assert_called('POST', '/shares/1234/action')
+
+    def test_allow_access_to_share_with_invalid_ip(self):
+        share = cs.shares.get(1234)
+        for ip in ('10.0.0', '10.0.0.256', '10.0.0.1/24/1', 'a.b.c.d',
+                   '10.0.0.1/33'):
+            self.assertRaises(exceptions.CommandError,
+                              share.allow, 'ip', ip)
+
+    def test_allow_access_to_share_with_invalid_prefix(self):
+        share = cs.shares.get(1234)
+        for ip in ('10.0.0.1/ab', '10.0.0.1/33', '10.0.0.1/033',
+                   '10.0.0.1/-1', '10.0.0.1/'):
+            exc = self.assertRaises(exceptions.CommandError,
+                                    share.allow, 'ip', ip)
+            self.assertEqual('IP prefix should be in range from 0 to 32',
+                             str(exc))
+
+    def test_allow_access_to_share_with_leading_zero_octets(self):
+        share = cs.shares.get(1234)
+        for ip in ('10.0.0.08', '010.0.0.1'):
+            share.allow('ip', ip)
+            cs.assert_called('POST', '/shares/1234/action')
+
+    def test_allow_access_to_share_by_sid(self):
+        share = cs.shares.get(1234)
+        share.allow('sid', 'fake_user')
+        cs.assert_called('POST', '/shares/1234/action')
+
+    def test_allow_access_to_share_with_invalid_sid(self):
+        share = cs.shares.get(1234)
+        for sid in ('usr', 'x' * 33, 'fake user', 'fake_user\n'):
+            self.assertRaises(exceptions.CommandError,
+                              share.allow, 'sid', sid)
@@ -13,7 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import fixtures
+import collections
+import os
 
 import mock
 
@@ -25,6 +26,47 @@ from tests import utils
 from tests.v1 import fakes
 
 
+# mimic the result of argparse's parse_args() method
+Arguments = collections.namedtuple('Arguments', ['metadata'])
+
+_CMD_LIST = ('list',)
+_CMD_LIST_STATUS = ('list', '--status=available')
+_CMD_LIST_NAME = ('list', '--name=1234')
+_CMD_LIST_ALL_TENANTS = ('list', '--all-tenants=1')
+_CMD_SHOW_1234 = ('show', '1234')
+_CMD_DELETE_1234 = ('delete', '1234')
+_CMD_SNAPSHOT_LIST_SHARE_ID = ('snapshot-list', '--share-id=1234')
+_CMD_SNAPSHOT_LIST_STATUS_SHARE_ID = ('snapshot-list', '--status=available',
+                                      '--share-id=1234')
+
+_CREATE_SHARE_TEMPLATE = {
+    "metadata": {},
+    "share_proto": "nfs",
+    "size": 1,
+}
+_RESET_STATUS_AVAILABLE = {'os-reset_status': {'status': 'available'}}
+_RESET_STATUS_ERROR = {'os-reset_status': {'status': 'error'}}
+
+
+def _get_fake_client_class(*args):
+    return fakes.FakeClient
+
+
+def _cached_subcommand_parser(_shell):
+    """Wrap _shell.get_subcommand_parser to build each version only once."""
+    parsers = {}
+    get_subcommand_parser = _shell.get_subcommand_parser
+
+    def _get_subcommand_parser(version):
+        if version not in parsers:
+            parser = get_subcommand_parser(version)
+            parsers[version] = (parser, _shell.subcommands)
+        parser, _shell.subcommands = parsers[version]
+        return parser
+
+    return _get_subcommand_parser
+
+
 class ShellTest(utils.TestCase):
 
     FAKE_ENV = {
@@ -35,34 +77,46 @@ class ShellTest(utils.TestCase):
         'MANILA_URL': 'http://no.where',
     }
 
+    @classmethod
+    def setUpClass(cls):
+        super(ShellTest, cls).setUpClass()
+        # NOTE: building the subcommand parser dominates the cost of each
+        # test, so share one shell between the tests and build its parser
+        # only once. FAKE_ENV does not change between tests, so the
+        # environment defaults captured by the parser stay valid.
+        cls._shell = shell.OpenStackManilaShell()
+        cls._shell.cs = None
+        cls._shell.get_subcommand_parser = _cached_subcommand_parser(
+            cls._shell)
+
     # Patch os.environ to avoid required auth info.
     def setUp(self):
         """Run before each test."""
         super(ShellTest, self).setUp()
-        for var in self.FAKE_ENV:
-            self.useFixture(fixtures.EnvironmentVariable(var,
-                                                         self.FAKE_ENV[var]))
+        patcher = mock.patch.dict(os.environ, self.FAKE_ENV)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
-        self.shell = shell.OpenStackManilaShell()
+        self.shell = self._shell
 
         #HACK(bcwaldon): replace this when we start using stubs
-        self.old_get_client_class = client.get_client_class
-        client.get_client_class = lambda *_: fakes.FakeClient
+        self.addCleanup(setattr, client, 'get_client_class',
+                        client.get_client_class)
+        client.get_client_class = _get_fake_client_class
 
     def tearDown(self):
         # For some method like test_image_meta_bad_action we are
-        # testing a SystemExit to be thrown and object self.shell has
-        # no time to get instantatiated which is OK in this case, so
-        # we make sure the method is there before launching it.
-        if hasattr(self.shell, 'cs'):
+        # testing a SystemExit to be thrown and object self.shell.cs has
+        # no time to get instantiated which is OK in this case, so we
+        # only clear it when it was set, then reset it for the next test.
+        if self.shell.cs is not None:
             self.shell.cs.clear_callstack()
-
-        #HACK(bcwaldon): replace this when we start using stubs
-        client.get_client_class = self.old_get_client_class
+            self.shell.cs = None
         super(ShellTest, self).tearDown()
 
     def run_command(self, cmd):
-        self.shell.main(cmd.split())
+        argv = cmd if isinstance(cmd, tuple) else cmd.split()
+        self.shell.main(list(argv))
 
     def assert_called(self, method, url, body=None, **kwargs):
         return self.shell.cs.assert_called(method, url, body, **kwargs)
@@ -70,39 +124,39 @@ class ShellTest(utils.TestCase):
     def assert_called_anytime(self, method, url, body=None):
         return self.shell.cs.assert_called_anytime(method, url, body)
 
-    def test_list(self):
-        self.run_command('list')
-        # NOTE(jdg): we default to detail currently
-        self.assert_called('GET', '/shares/detail')
-
-    def test_list_filter_status(self):
-        self.run_command('list --status=available')
-        self.assert_called('GET', '/shares/detail?status=available')
-
-    def test_list_filter_name(self):
-        self.run_command('list --name=1234')
-        self.assert_called('GET', '/shares/detail?name=1234')
+    # NOTE(jdg): we default to detail currently
+    _LIST_CASES = (
+        (_CMD_LIST, '/shares/detail'),
+        (_CMD_LIST_STATUS, '/shares/detail?status=available'),
+        (_CMD_LIST_NAME, '/shares/detail?name=1234'),
+        (_CMD_LIST_ALL_TENANTS, '/shares/detail?all_tenants=1'),
+    )
 
-    def test_list_all_tenants(self):
-        self.run_command('list --all-tenants=1')
-        self.assert_called('GET', '/shares/detail?all_tenants=1')
+    def test_list(self):
+        for cmd, url in self._LIST_CASES:
+            self.run_command(cmd)
+            self.assert_called('GET', url)
+            self.shell.cs.clear_callstack()
 
     def test_show(self):
-        self.run_command('show 1234')
+        self.run_command(_CMD_SHOW_1234)
         self.assert_called('GET', '/shares/1234')
 
     def test_delete(self):
-        self.run_command('delete 1234')
+        self.run_command(_CMD_DELETE_1234)
         self.assert_called('DELETE', '/shares/1234')
 
-    def test_snapshot_list_filter_share_id(self):
-        self.run_command('snapshot-list --share-id=1234')
-        self.assert_called('GET', '/snapshots/detail?share_id=1234')
+    _SNAPSHOT_LIST_CASES = (
+        (_CMD_SNAPSHOT_LIST_SHARE_ID, '/snapshots/detail?share_id=1234'),
+        (_CMD_SNAPSHOT_LIST_STATUS_SHARE_ID,
+         '/snapshots/detail?status=available&share_id=1234'),
+    )
 
-    def test_snapshot_list_filter_status_and_share_id(self):
-        self.run_command('snapshot-list --status=available --share-id=1234')
-        self.assert_called('GET', '/snapshots/detail?'
-                           'status=available&share_id=1234')
+    def test_snapshot_list(self):
+        for cmd, url in self._SNAPSHOT_LIST_CASES:
+            self.run_command(cmd)
+            self.assert_called('GET', url)
+            self.shell.cs.clear_callstack()
 
     def test_rename(self):
         # basic rename with positional agruments
@@ -167,44 +221,36 @@ class ShellTest(utils.TestCase):
         self.assert_called('PUT', '/shares/1234/metadata',
                            {'metadata': {'key1': 'val1', 'key2': 'val2'}})
 
+    _EXTRACT_METADATA_CASES = (
+        ((), {}),
+        (("key=value",), {"key": "value"}),
+        (("key",), {"key": None}),
+        (("k1=v1", "k2=v2"), {"k1": "v1", "k2": "v2"}),
+        (("k1=v1", "k2"), {"k1": "v1", "k2": None}),
+        (("k1", "k2=v2"), {"k1": None, "k2": "v2"}),
+    )
+
     def test_extract_metadata(self):
-        # mimic the result of argparse's parse_args() method
-        class Arguments:
-            def __init__(self, metadata=[]):
-                self.metadata = metadata
-
-        inputs = [
-            ([], {}),
-            (["key=value"], {"key": "value"}),
-            (["key"], {"key": None}),
-            (["k1=v1", "k2=v2"], {"k1": "v1", "k2": "v2"}),
-            (["k1=v1", "k2"], {"k1": "v1", "k2": None}),
-            (["k1", "k2=v2"], {"k1": None, "k2": "v2"})
-        ]
-
-        for input in inputs:
-            args = Arguments(metadata=input[0])
-            self.assertEqual(shell_v1._extract_metadata(args), input[1])
+        for metadata, expected in self._EXTRACT_METADATA_CASES:
+            self.assertEqual(shell_v1._extract_metadata(Arguments(metadata)),
+                             expected)
+
+    _RESET_STATE_CASES = (
+        ('reset-state 1234', '/shares/1234/action',
+         _RESET_STATUS_AVAILABLE),
+        ('reset-state --state error 1234', '/shares/1234/action',
+         _RESET_STATUS_ERROR),
+        ('snapshot-reset-state 1234', '/snapshots/1234/action',
+         _RESET_STATUS_AVAILABLE),
+        ('snapshot-reset-state --state error 1234', '/snapshots/1234/action',
+         _RESET_STATUS_ERROR),
+    )
 
     def test_reset_state(self):
-        self.run_command('reset-state 1234')
-        expected = {'os-reset_status': {'status': 'available'}}
-        self.assert_called('POST', '/shares/1234/action', body=expected)
-
-    def test_reset_state_with_flag(self):
-        self.run_command('reset-state --state error 1234')
-        expected = {'os-reset_status': {'status': 'error'}}
-        self.assert_called('POST', '/shares/1234/action', body=expected)
-
-    def test_snapshot_reset_state(self):
-        self.run_command('snapshot-reset-state 1234')
-        expected = {'os-reset_status': {'status': 'available'}}
-        self.assert_called('POST', '/snapshots/1234/action', body=expected)
-
-    def test_snapshot_reset_state_with_flag(self):
-        self.run_command('snapshot-reset-state --state error 1234')
-        expected = {'os-reset_status': {'status': 'error'}}
-        self.assert_called('POST', '/snapshots/1234/action', body=expected)
+        for cmd, url, body in self._RESET_STATE_CASES:
+            self.run_command(cmd)
+            self.assert_called('POST', url, body=body)
+            self.shell.cs.clear_callstack()
 
     def test_share_network_security_service_list_by_name(self):
         self.run_command('share-network-security-service-list fake_share_nw')
@@ -225,54 +271,25 @@ class ShellTest(utils.TestCase):
     def test_create_share(self):
         # Use only required fields
         self.run_command("create nfs 1")
-        expected = {
-            "share": {
-                "volume_type": None,
-                "name": None,
-                "snapshot_id": None,
-                "description": None,
-                "metadata": {},
-                "share_proto": "nfs",
-                "share_network_id": None,
-                "size": 1,
-            }
-        }
+        expected = {"share": _CREATE_SHARE_TEMPLATE}
         self.assert_called("POST", "/shares", body=expected)
 
     def test_create_with_share_network(self):
         # Except required fields added share network
         sn = "fake-share-network"
-        with mock.patch.object(shell_v1, "_find_share_network",
-                               mock.Mock(return_value=sn)):
-            self.run_command("create nfs 1 --share-network %s" % sn)
-            expected = {
-                "share": {
-                    "volume_type": None,
-                    "name": None,
-                    "snapshot_id": None,
-                    "description": None,
-                    "metadata": {},
-                    "share_proto": "nfs",
-                    "share_network_id": sn,
-                    "size": 1,
-                }
-            }
-            self.assert_called("POST", "/shares", body=expected)
-            shell_v1._find_share_network.assert_called_once_with(mock.ANY, sn)
+        self.addCleanup(setattr, shell_v1, '_find_share_network',
+                        shell_v1._find_share_network)
+        shell_v1._find_share_network = mock.Mock(return_value=sn)
+        self.run_command("create nfs 1 --share-network %s" % sn)
+        expected = {
+            "share": dict(_CREATE_SHARE_TEMPLATE, share_network_id=sn),
+        }
+        self.assert_called("POST", "/shares", body=expected)
+        shell_v1._find_share_network.assert_called_once_with(mock.ANY, sn)
 
     def test_create_with_metadata(self):
         # Except required fields added metadata
         self.run_command("create nfs 1 --metadata key1=value1 key2=value2")
-        expected = {
-            "share": {
-                "volume_type": None,
-                "name": None,
-                "snapshot_id": None,
-                "description": None,
-                "metadata": {"key1": "value1", "key2": "value2"},
-                "share_proto": "nfs",
-                "share_network_id": None,
-                "size": 1,
-            }
-        }
+        metadata = {"key1": "value1", "key2": "value2"}
+        expected = {"share": dict(_CREATE_SHARE_TEMPLATE, metadata=metadata)}
         self.assert_called("POST", "/shares", body=expected)